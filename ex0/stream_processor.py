@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 
+import re
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from collections.abc import Iterable
+from numbers import Number
+from typing import Any, List, Optional, Tuple
+
+_LOG_ERR = re.compile(r'error', re.IGNORECASE)
 
 
 class DataProcessor(ABC):
@@ -30,32 +35,45 @@ class NumericProcessor(DataProcessor):
 
     def process(self, data: Any) -> str:
         """Process numeric data to calculate sum and average."""
-        number_count = 0
-        sum = 0
-
         print(f"Processing data: {data}")
 
-        if not self.validate(data):
+        checked = self._sum_count(data)
+        if checked is None:
             return
-        for number in data:
-            number_count += 1
-            sum += number
+        total, number_count = checked
 
-        avg = sum / number_count
-        result = (f"Processed {number_count} numeric values, sum={sum},"
+        avg = total / number_count
+        result = (f"Processed {number_count} numeric values, sum={total},"
                   f"avg={avg}")
         return (result)
 
     def validate(self, data: Any) -> bool:
-        """Ensure all items in data are numeric."""
+        """Ensure data is a non-empty collection of numbers that can be
+        summed."""
+        return self._sum_count(data) is not None
+
+    def _sum_count(self, data: Any) -> Optional[Tuple[Any, int]]:
+        """Sum data in a single pass, report the validation result and
+        return (sum, count), or None if data is invalid."""
         try:
+            number_count = len(data)
+            total = sum(data)
+        except TypeError:
+            if not isinstance(data, Iterable):
+                print("Invalid numeric data: expected a collection of "
+                      f"numbers, got {type(data).__name__}")
+                return None
             for number in data:
-                int(number)
-            print("Validation: Numeric data verified")
-            return True
-        except ValueError:
-            print(f"Invalid numeric data: '{number}' is not a number")
-            return False
+                if not isinstance(number, Number):
+                    print(f"Invalid numeric data: '{number}' is not a number")
+                    return None
+            print("Invalid numeric data: values cannot be added together")
+            return None
+        if number_count == 0:
+            print("Invalid numeric data: no values to process")
+            return None
+        print("Validation: Numeric data verified")
+        return (total, number_count)
 
 
 class TextProcessor(DataProcessor):
@@ -66,24 +84,14 @@ class TextProcessor(DataProcessor):
 
     def process(self, data: Any) -> str:
         """Process text to count characters and words."""
-        word_count = 0
-        ch_count = 0
-
         print(f"Processing data: {data}")
 
-        try:
-            if not self.validate(data):
-                raise ValueError("Invalid text data")
-            print("Validation: Text data verified")
-        except ValueError as e:
-            print(f"Error {e}")
+        if not self.validate(data):
+            print("Error Invalid text data")
             return
-        for char in data:
-            if word_count == 0 and char != ' ':
-                word_count += 1
-            elif char != ' ' and not data[ch_count - 1] != ' ':
-                word_count += 1
-            ch_count += 1
+        print("Validation: Text data verified")
+        ch_count = len(data)
+        word_count = len(data.split())
 
         result = f"Processed text: {ch_count} characters, {word_count} words"
         return (result)
@@ -103,43 +111,32 @@ class LogProcessor(DataProcessor):
         """Process log entries to detect errors and capture message
         after colon."""
         result = ''
-        found = False
 
         print(f"Processing data: {data}")
-        try:
-            if not self.validate(data):
-                raise Exception("Invalid log data")
-            print("Validation: Log entry verified")
-        except Exception as e:
-            print(f"Error: {e}")
+        if not self.validate(data):
+            print("Error: Invalid log data")
             return
+        print("Validation: Log entry verified")
 
-        if "ERROR" in data or "Error" in data:
+        if _LOG_ERR.search(data):
             result = "[ALERT] ERROR level detected"
 
-        for ch in data:
-            if ch == ':':
-                found = True
-            if found:
-                result += ch
+        idx = data.find(':')
+        if idx != -1:
+            result += data[idx:]
         return (result)
 
     def validate(self, data: Any) -> bool:
         """Check if the log entry contains a colon character."""
-        for ch in data:
-            if ch == ':':
-                return True
-        return False
+        return isinstance(data, str) and ':' in data
 
 
 def polymorphic_demo(processors: List[tuple[DataProcessor, Any]]) -> None:
     """Demonstrate polymorphic processing for multiple data processors."""
-    i = 1
-    for processor, data in processors:
+    for i, (processor, data) in enumerate(processors, 1):
         result = processor.process(data)
         if result:
             print(f"Result {i}: {result}\n")
-        i += 1
 
 
 def main() -> None:
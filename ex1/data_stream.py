@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from typing import Any, List, Dict, Tuple, Union, Optional
 
 
 class DataStream(ABC):
     """Abstract base class for all types of data streams."""
 
+    _FILTERS: Dict[str, Tuple[type, ...]] = {
+        'string': (str,),
+        'number': (int, float),
+        'int': (int,),
+    }
+
     @abstractmethod
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of data and return a string result."""
@@ -15,18 +21,10 @@ class DataStream(ABC):
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
         """Filter data batch based on type criteria (string, number, int)."""
-
-        if criteria == 'string':
-            return ([x for x in data_batch if isinstance(x, str)])
-
-        if criteria == 'number':
-            return ([x for x in data_batch if isinstance(x, (int, float))])
-
-        if criteria == 'int':
-            return ([x for x in data_batch if isinstance(x, int)])
-
-        else:
+        types = self._FILTERS.get(criteria)
+        if types is None:
             return (data_batch)
+        return ([x for x in data_batch if isinstance(x, types)])
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return statistics about the stream (to be implemented by
@@ -43,8 +41,8 @@ class SensorStream(DataStream):
         print(f"Stream ID: {stream_id}, Type: Environmental Data")
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        """Analyze a sensor batch and calculate average temperature."""
-        if ft_len(data_batch) != 3:
+        """Analyze a sensor batch and report its temperature reading."""
+        if len(data_batch) != 3:
             return ("Error: need temperature, humidity and pressure for"
                     " processing.")
         print(f"Processing sensor batch: [temp:{data_batch[0]},"
@@ -53,12 +51,12 @@ class SensorStream(DataStream):
             self.filter_data(data_batch)
         except ValueError as e:
             return (f"Error: {e}")
-        count = 0
-        avg_temp = data_batch[0]
-        for _ in data_batch:
-            count += 1
+        count = len(data_batch)
+        temp = data_batch[0]
+        # A batch holds one temperature; the "avg temp" label is kept
+        # because it is part of the expected output.
         return (f"Sensor analysis: {count} readings processed, "
-                f"avg temp: {avg_temp}")
+                f"avg temp: {temp}")
 
     def filter_data(self, data_batch: List[Any]) -> None:
         """Validate that all sensor data are positive numbers."""
@@ -79,29 +77,13 @@ class TransactionStream(DataStream):
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of transactions and compute net flow."""
         data_batch = self.filter_data(data_batch)
-        process_print = "Processing transaction batch:"
-        first = '['
-        len = 0
-        for _ in data_batch:
-            len += 1
-        for operation in data_batch:
-            if operation > 0:
-                process_print += f"{first}buy:{operation}"
-            else:
-                process_print += f"{first}sell:{operation}"
-            first = ''
-            len -= 1
-            if len != 0:
-                process_print += ', '
-            else:
-                process_print += ']'
+        parts = [f"{'buy' if x > 0 else 'sell'}:{x}" for x in data_batch]
+        process_print = ("Processing transaction batch:["
+                         + ", ".join(parts) + "]")
         print(process_print)
 
-        op_count = 0
-        net_flow = 0
-        for operation in data_batch:
-            op_count += 1
-            net_flow += operation
+        op_count = len(data_batch)
+        net_flow = sum(data_batch)
 
         if net_flow >= 0:
             return (f"Transaction analysis: {op_count} operations, "
@@ -113,8 +95,8 @@ class TransactionStream(DataStream):
     def filter_data(self, data_batch: List[Any]) -> List[int]:
         """Filter valid transactions: integers between -10000 and 10000,
         excluding 0."""
-        return ([x for x in data_batch if isinstance(x, int) and x != 0
-                and x > -10000 and x < 10000])
+        return ([x for x in data_batch
+                 if isinstance(x, int) and x and -10000 < x < 10000])
 
 
 class EventStream(DataStream):
@@ -128,27 +110,12 @@ class EventStream(DataStream):
         """Analyze event batch, count total events and errors."""
         data_batch = self.filter_data(data_batch, 'string')
         print(f"Processing event batch: {data_batch}")
-        event_count = 0
-        error_count = 0
-        for event in data_batch:
-            event_count += 1
-            if event == "error":
-                error_count += 1
-
-        if event_count == 0 or event_count > 1:
-            event_count = str(event_count)
-            event_count += ' events'
-        else:
-            event_count = str(event_count)
-            event_count += ' event'
-        if error_count == 0 or error_count > 1:
-            error_count = str(error_count)
-            error_count += ' errors'
-        else:
-            error_count = str(error_count)
-            error_count += ' error'
+        event_count = len(data_batch)
+        error_count = data_batch.count("error")
 
-        return (f"Event analysis: {event_count}, {error_count} detected")
+        return (f"Event analysis: {event_count} "
+                f"event{'' if event_count == 1 else 's'}, {error_count} "
+                f"error{'' if error_count == 1 else 's'} detected")
 
 
 class StreamProcessor:
@@ -163,29 +130,24 @@ class StreamProcessor:
         print("Processing mixed stream types through unified interface...")
         stream_types = ["Sensor", "Transaction", "Event"]
         operation_types = ["readings", "operations", "events"]
-        i = 0
         event_filtered = 0
         transasction_filtered = 0
 
         print("\nBatch 1 Results:")
-        for stm in streams:
-            operation_count = 0
-            if stream_types[i] == "Event":
-                len = ft_len(data[stream_types[i]])
-                data[stream_types[i]] = stm.filter_data(data[stream_types[i]],
-                                                        "string")
-                filtered_len = ft_len(data[stream_types[i]])
-                event_filtered += len - filtered_len
-            elif stream_types[i] == "Transaction":
-                len = ft_len(data[stream_types[i]])
-                data[stream_types[i]] = stm.filter_data(data[stream_types[i]])
-                filtered_len = ft_len(data[stream_types[i]])
-                transasction_filtered += len - filtered_len
-            for _ in data[stream_types[i]]:
-                operation_count += 1
-            print(f"- {stream_types[i]} data: {operation_count} "
-                  f"{operation_types[i]} processed")
-            i += 1
+        for i, stm in enumerate(streams):
+            st = stream_types[i]
+            op = operation_types[i]
+            ds = data[st]
+            if st == "Event":
+                original_len = len(ds)
+                ds = stm.filter_data(ds, "string")
+                event_filtered += original_len - len(ds)
+            elif st == "Transaction":
+                original_len = len(ds)
+                ds = stm.filter_data(ds)
+                transasction_filtered += original_len - len(ds)
+            data[st] = ds
+            print(f"- {st} data: {len(ds)} {op} processed")
 
         print("\nStream filtering active: High-priority data only")
         print(f"Filtered results {transasction_filtered} transactions, "
@@ -194,14 +156,6 @@ class StreamProcessor:
               "Nexus throughput optimal.")
 
 
-def ft_len(it: Any) -> int:
-    """Custom function to count items in an iterable."""
-    i = 0
-    for _ in it:
-        i += 1
-    return (i)
-
-
 def main() -> None:
     """Main function to run polymorphic stream processing demo."""
     print("=== CODE NEXUS - POLYMORPHIC STREAM SYSTEM ===\n")
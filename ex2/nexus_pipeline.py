@@ -21,7 +21,7 @@ class ProcessingPipeline(ABC):
 
     def add_stage(self, stage: ProcessingStage) -> None:
         """Add a processing stage to the pipeline."""
-        self.stages += [stage]
+        self.stages.append(stage)
 
     @abstractmethod
     def process(self, data: Any) -> Any:
@@ -123,18 +123,16 @@ class NexusManager:
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
         """Add a pipeline to the manager."""
-        self.pipelines += [pipeline]
+        self.pipelines.append(pipeline)
 
     def process_data(self, data: Any) -> None:
         """Process data through all managed pipelines."""
         try:
-            i: int = 0
-            for pipeline in self.pipelines:
+            for i, pipeline in enumerate(self.pipelines):
                 try:
                     pipeline.process(data[i])
                 except ValueError:
                     return
-                i += 1
                 print()
         except TypeError:
             print("Error detected in Stage 2. No data received")